@@ -0,0 +1,202 @@
+"""Load driver for one service, run by run.py in the service's directory.
+
+Reads a JSON config on stdin and writes a JSON result on stdout.
+"""
+import asyncio
+import importlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from services import OPS, SERVICES
+
+
+def load_env():
+    """Load the service's .env the way its app would, without overriding.
+
+    Only if the service's interpreter has python-dotenv: a service without
+    it doesn't read .env either.
+    """
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(os.path.join(os.getcwd(), ".env"))
+
+
+def load_app(spec):
+    sys.path.insert(0, os.getcwd())
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def schedule(mix, requests, seed):
+    """A reproducible sequence of op names drawn from the weighted mix."""
+    names = sorted(mix)
+    rng = random.Random(seed)
+    return rng.choices(names, weights=[mix[name] for name in names], k=requests)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed):
+    """``samples`` is a list of ``(op, seconds, ok)``."""
+    by_op = {}
+    for op, seconds, ok in samples:
+        by_op.setdefault(op, []).append((seconds, ok))
+
+    ops = {}
+    for op, values in sorted(by_op.items()):
+        latencies = sorted(seconds * 1000 for seconds, _ in values)
+        ops[op] = {
+            "requests": len(values),
+            "errors": sum(1 for _, ok in values if not ok),
+            "mean_ms": round(sum(latencies) / len(latencies), 3),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p90_ms": round(percentile(latencies, 90), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+        }
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for _, _, ok in samples if not ok),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else None,
+        "ops": ops,
+    }
+
+
+def run_wsgi(app, plan, concurrency, prefix):
+    local = threading.local()
+
+    def one(item):
+        seq, op = item
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        method, path, body = OPS[op]["build"](prefix, seq)
+        start = time.perf_counter()
+        response = client.open(path, method=method, json=body)
+        return op, time.perf_counter() - start, response.status_code in OPS[op]["ok"]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        samples = list(pool.map(one, plan))
+        return samples, time.perf_counter() - start
+
+
+async def _drive(client, plan, concurrency, prefix):
+    import httpx
+
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(item):
+        seq, op = item
+        method, path, body = OPS[op]["build"](prefix, seq)
+        async with limit:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                ok = response.status_code in OPS[op]["ok"]
+            except httpx.HTTPError:
+                ok = False
+            return op, time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    samples = await asyncio.gather(*(one(item) for item in plan))
+    return list(samples), time.perf_counter() - start
+
+
+async def run_asgi(app, warmup, plan, concurrency, prefix):
+    import httpx
+
+    # ASGITransport doesn't run the lifespan, so enter it here.
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _drive(client, warmup, concurrency, prefix)
+            return await _drive(client, plan, concurrency, prefix)
+
+
+async def run_uvicorn(spec, warmup, plan, concurrency, prefix):
+    import httpx
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", spec, "--port", str(port), "--log-level", "warning"],
+        cwd=os.getcwd(),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    await client.get("/")
+                    break
+                except httpx.TransportError:
+                    if time.monotonic() > deadline or server.poll() is not None:
+                        raise RuntimeError("uvicorn did not start") from None
+                    await asyncio.sleep(0.1)
+            await _drive(client, warmup, concurrency, prefix)
+            return await _drive(client, plan, concurrency, prefix)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    config = json.load(sys.stdin)
+    service = SERVICES[config["service"]]
+
+    mix = dict(config.get("mix") or service["mix"])
+    load_env()
+    skipped = []
+    if not os.getenv("DATABASE_URL"):
+        skipped = sorted(op for op in mix if op in service["needs_db"])
+        for op in skipped:
+            del mix[op]
+    if not mix:
+        json.dump({"skipped": skipped, "mix": {}}, sys.stdout)
+        return
+
+    # A fresh prefix per run keeps names unique even against a persistent DB.
+    prefix = uuid.uuid4().hex[:8]
+    warmup = list(enumerate(schedule(mix, config["warmup"], config["seed"] + 1), start=-config["warmup"]))
+    plan = list(enumerate(schedule(mix, config["requests"], config["seed"])))
+    transport = config["transport"]
+    if transport == "uvicorn" and service["interface"] != "asgi":
+        raise SystemExit("--transport uvicorn only supports ASGI services")
+
+    concurrency = config["concurrency"]
+    if transport == "uvicorn":
+        samples, elapsed = asyncio.run(run_uvicorn(service["app"], warmup, plan, concurrency, prefix))
+    elif service["interface"] == "wsgi":
+        app = load_app(service["app"])
+        run_wsgi(app, warmup, concurrency, prefix)
+        samples, elapsed = run_wsgi(app, plan, concurrency, prefix)
+    else:
+        app = load_app(service["app"])
+        samples, elapsed = asyncio.run(run_asgi(app, warmup, plan, concurrency, prefix))
+
+    result = summarize(samples, elapsed)
+    result.update({"mix": mix, "skipped": skipped})
+    json.dump(result, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Benchmark harness for the daily API services.
+
+Runs each service in-process (Flask test client, or httpx's ASGI
+transport for FastAPI) or behind a local uvicorn, drives it with a
+seeded, weighted request mix at a given concurrency, and writes
+throughput and latency percentiles as JSON. With --baseline, the run is
+compared against a previous result and the exit status is 1 if any
+service or op regressed past --threshold, or if a service or op in the
+baseline was skipped or missing from this run. By default the gate
+checks throughput and p50; latency changes under --min-delta-ms are
+ignored.
+
+    python bench/run.py                                   # all services
+    python bench/run.py --service day-04-fastapi-hello-postgres --transport uvicorn --concurrency 16
+    python bench/run.py --write-baseline bench/baseline.json
+    python bench/run.py --baseline bench/baseline.json --threshold 0.25
+
+Each service runs in its own directory under its own interpreter (the
+"python" entry in SERVICES, usually the service's .venv; --python
+overrides it). Ops that need a database are skipped unless DATABASE_URL
+is set in the environment or the service's .env, so compare against a
+baseline recorded with the same database setup.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from services import OPS, SERVICES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DRIVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "driver.py")
+
+
+def parse_mix(value):
+    """``"list_foods=5,add_food=1"`` -> ``{"list_foods": 5, "add_food": 1}``."""
+    mix = {}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        if op not in OPS:
+            raise argparse.ArgumentTypeError(f"unknown op {op!r}; choose from {', '.join(sorted(OPS))}")
+        mix[op] = float(weight or 1)
+    return mix
+
+
+def run_service(name, args):
+    """Run the driver ``args.repeat`` times and keep the median of each stat.
+
+    Taking the median per stat (rather than one whole run) means a single
+    noisy run can't move any number that the gate looks at.
+    """
+    runs = [run_driver(name, args) for _ in range(args.repeat)]
+    merged = dict(runs[0])
+    if not merged.get("ops"):
+        return merged
+    merged["errors"] = max(run["errors"] for run in runs)
+    for key in ("seconds", "throughput_rps"):
+        merged[key] = statistics.median(run[key] for run in runs)
+    merged["ops"] = {}
+    for op, first in runs[0]["ops"].items():
+        samples = [run["ops"][op] for run in runs if op in run["ops"]]
+        merged["ops"][op] = {
+            key: max(sample[key] for sample in samples) if key == "errors"
+            else statistics.median(sample[key] for sample in samples)
+            for key in first
+        }
+    return merged
+
+
+def service_python(name):
+    """The service's own interpreter, or this one if it hasn't been set up."""
+    service = SERVICES[name]
+    python = os.path.join(ROOT, service["dir"], service["python"])
+    if os.path.exists(python):
+        return python
+    print(f"{name}: {service['python']} not found, using {sys.executable}", file=sys.stderr)
+    return sys.executable
+
+
+def run_driver(name, args):
+    config = {
+        "service": name,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+        "seed": args.seed,
+        "mix": args.mix,
+        "transport": args.transport,
+    }
+    result = subprocess.run(
+        [args.python or service_python(name), DRIVER],
+        input=json.dumps(config), capture_output=True, text=True,
+        cwd=os.path.join(ROOT, SERVICES[name]["dir"]),
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{name}: driver failed\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def compare(current, baseline, threshold, metrics=("p50_ms",), min_delta_ms=2.0, min_tail_samples=200):
+    """Regressions of ``current`` vs ``baseline`` beyond ``threshold`` (a fraction).
+
+    A latency stat only counts as regressed when it is both ``threshold``
+    slower and at least ``min_delta_ms`` slower, since in-process latencies
+    of well under a millisecond move by more than 20% on scheduler noise
+    alone. Tail stats (p90/p99) are only compared for ops with at least
+    ``min_tail_samples`` requests in both runs.
+    """
+    problems = []
+    for name, base in baseline["services"].items():
+        if not base.get("ops"):
+            continue
+        run = current["services"].get(name)
+        if run is None:
+            problems.append(f"{name}: in the baseline but not run")
+            continue
+        if run.get("errors"):
+            problems.append(f"{name}: {run['errors']} failed requests")
+        if not run.get("throughput_rps"):
+            problems.append(f"{name}: no requests run (skipped: {', '.join(run.get('skipped', []))})")
+            continue
+        if run["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+            problems.append(
+                f"{name}: throughput {run['throughput_rps']} rps < baseline {base['throughput_rps']} rps"
+            )
+        for op, base_op in base["ops"].items():
+            run_op = run["ops"].get(op)
+            if run_op is None:
+                reason = "skipped, DATABASE_URL unset?" if op in run.get("skipped", []) else "not in this run's mix"
+                problems.append(f"{name} {op}: in the baseline but {reason}")
+                continue
+            for key in metrics:
+                if key != "p50_ms" and min(run_op["requests"], base_op["requests"]) < min_tail_samples:
+                    continue
+                slower = run_op[key] - base_op[key]
+                if run_op[key] > base_op[key] * (1 + threshold) and slower >= min_delta_ms:
+                    problems.append(f"{name} {op}: {key} {run_op[key]} > baseline {base_op[key]}")
+    return problems
+
+
+def print_report(results):
+    for name, run in results["services"].items():
+        if not run.get("ops"):
+            print(f"{name}: skipped ({', '.join(run['skipped'])} need DATABASE_URL)")
+            continue
+        print(f"{name}: {run['throughput_rps']} req/s, {run['errors']} errors")
+        for op, stats in run["ops"].items():
+            print(
+                f"  {op:>14}  n={stats['requests']:<6} p50 {stats['p50_ms']:>8.2f} ms"
+                f"  p90 {stats['p90_ms']:>8.2f} ms  p99 {stats['p99_ms']:>8.2f} ms"
+            )
+        if run["skipped"]:
+            print(f"  skipped: {', '.join(run['skipped'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--service", action="append", choices=sorted(SERVICES), help="repeatable; default all")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument(
+        "--concurrency", type=int, default=1,
+        help="requests in flight; above 1, in-process latencies mostly measure GIL scheduling",
+    )
+    parser.add_argument("--seed", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per service; each stat is the median over runs")
+    parser.add_argument("--mix", type=parse_mix, help="override the service mix, e.g. list_foods=5,add_food=1")
+    parser.add_argument("--transport", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--python", help="interpreter for every service (default: each service's own)")
+    parser.add_argument("--out", default=os.path.join(ROOT, "bench", "results.json"))
+    parser.add_argument("--baseline", help="fail if this run regresses against the given result file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression, as a fraction")
+    parser.add_argument(
+        "--gate", default="p50_ms",
+        help="per-op latency stats checked against the baseline, e.g. p50_ms,p99_ms (throughput is always checked)",
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=2.0,
+        help="ignore latency regressions smaller than this, whatever the percentage",
+    )
+    parser.add_argument(
+        "--min-tail-samples", type=int, default=200,
+        help="only gate p90/p99 for ops with at least this many requests",
+    )
+    parser.add_argument("--write-baseline", metavar="PATH", help="also save this run as the new baseline")
+    args = parser.parse_args()
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {key: getattr(args, key) for key in ("requests", "warmup", "concurrency", "seed", "repeat", "mix", "transport")},
+        "services": {name: run_service(name, args) for name in args.service or sorted(SERVICES)},
+    }
+    print_report(results)
+
+    for path in filter(None, (args.out, args.write_baseline)):
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if args.service:
+            # Services left out on purpose with --service aren't "missing".
+            baseline["services"] = {
+                name: run for name, run in baseline["services"].items() if name in args.service
+            }
+        problems = compare(
+            results, baseline, args.threshold, args.gate.split(","),
+            args.min_delta_ms, args.min_tail_samples,
+        )
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        if problems:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
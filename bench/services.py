@@ -0,0 +1,48 @@
+"""Benchmarked services and the request mixes they are driven with.
+
+To gate a new day's service, add an entry to SERVICES: where it lives, the
+interpreter that has its dependencies (relative to its directory), how to
+load its app, and a weighted mix of operations from OPS (or new ones).
+"""
+
+# Each op builds ``(method, path, json_body)`` from a per-run prefix and the
+# request's sequence number, and lists the statuses that count as success.
+OPS = {
+    "root": {"build": lambda run, seq: ("GET", "/", None), "ok": {200}},
+    "health": {"build": lambda run, seq: ("GET", "/health", None), "ok": {200}},
+    "health_db": {"build": lambda run, seq: ("GET", "/health/db", None), "ok": {200}},
+    "list_foods": {"build": lambda run, seq: ("GET", "/foods?limit=100", None), "ok": {200, 304}},
+    "add_food": {
+        "build": lambda run, seq: ("POST", "/foods", {"name": f"food-{run}-{seq}"}),
+        "ok": {201},
+    },
+    "add_duplicate": {
+        # Same name in a different case every time: exercises the dedup path.
+        "build": lambda run, seq: ("POST", "/foods", {"name": f"DUP-{run}" if seq % 2 else f"dup-{run}"}),
+        "ok": {201, 409},
+    },
+    "bulk_add": {
+        "build": lambda run, seq: ("POST", "/foods/bulk", [{"name": f"bulk-{run}-{seq}-{i}"} for i in range(100)]),
+        "ok": {200},
+    },
+}
+
+SERVICES = {
+    "day-05-flask-api-test": {
+        "dir": "daily/day-05-flask-api-test",
+        "python": ".venv/bin/python",
+        "interface": "wsgi",
+        "app": "app:app",
+        "mix": {"list_foods": 5, "add_food": 2, "add_duplicate": 2, "bulk_add": 1},
+        "needs_db": set(),
+    },
+    "day-04-fastapi-hello-postgres": {
+        "dir": "daily/day-04-fastapi-hello-postgres",
+        "python": ".venv/bin/python",
+        "interface": "asgi",
+        "app": "app.main:app",
+        "mix": {"root": 3, "health_db": 2, "list_foods": 2, "add_food": 1, "add_duplicate": 1, "bulk_add": 1},
+        # Dropped from the mix (and reported as skipped) without DATABASE_URL.
+        "needs_db": {"health_db", "list_foods", "add_food", "add_duplicate", "bulk_add"},
+    },
+}
@@ -0,0 +1,69 @@
+from run import compare
+
+
+def op(requests=100, p50=10.0, p99=20.0):
+    return {"requests": requests, "errors": 0, "p50_ms": p50, "p90_ms": p99, "p99_ms": p99}
+
+
+def service(ops, throughput=100.0, skipped=()):
+    return {"throughput_rps": throughput, "errors": 0, "ops": ops, "skipped": list(skipped)}
+
+
+def results(**services):
+    return {"services": services}
+
+
+BASELINE = results(api=service({"list": op(), "add": op()}))
+
+
+def test_same_numbers_pass():
+    assert compare(BASELINE, BASELINE, 0.2) == []
+
+
+def test_missing_service_fails():
+    assert compare(results(), BASELINE, 0.2) == ["api: in the baseline but not run"]
+
+
+def test_missing_op_fails():
+    current = results(api=service({"list": op()}, skipped=["add"]))
+    assert compare(current, BASELINE, 0.2) == ["api add: in the baseline but skipped, DATABASE_URL unset?"]
+    current = results(api=service({"list": op()}))
+    assert compare(current, BASELINE, 0.2) == ["api add: in the baseline but not in this run's mix"]
+
+
+def test_fully_skipped_service_fails():
+    current = results(api={"ops": {}, "skipped": ["list", "add"]})
+    assert compare(current, BASELINE, 0.2) == ["api: no requests run (skipped: list, add)"]
+
+
+def test_throughput_regression_fails():
+    current = results(api=service({"list": op(), "add": op()}, throughput=70.0))
+    assert compare(current, BASELINE, 0.2) == ["api: throughput 70.0 rps < baseline 100.0 rps"]
+
+
+def test_latency_regression_needs_both_threshold_and_min_delta():
+    baseline = results(api=service({"list": op(p50=1.0)}))
+    # +50% but only 0.5 ms slower: noise.
+    assert compare(results(api=service({"list": op(p50=1.5)})), baseline, 0.2, min_delta_ms=2.0) == []
+    # 2 ms slower, past both limits.
+    assert compare(results(api=service({"list": op(p50=3.0)})), baseline, 0.2, min_delta_ms=2.0) == [
+        "api list: p50_ms 3.0 > baseline 1.0",
+    ]
+    assert compare(results(api=service({"list": op(p50=1.5)})), baseline, 0.2, min_delta_ms=0.1) == [
+        "api list: p50_ms 1.5 > baseline 1.0",
+    ]
+
+
+def test_tail_stats_need_enough_samples():
+    metrics = ("p50_ms", "p99_ms")
+    baseline = results(api=service({"list": op(requests=100)}))
+    slow_tail = results(api=service({"list": op(requests=100, p99=40.0)}))
+    assert compare(slow_tail, baseline, 0.2, metrics, min_tail_samples=200) == []
+    assert compare(slow_tail, baseline, 0.2, metrics, min_tail_samples=100) == [
+        "api list: p99_ms 40.0 > baseline 20.0",
+    ]
+
+
+def test_baseline_without_ops_is_not_gated():
+    baseline = results(api={"ops": {}, "skipped": ["list"]})
+    assert compare(results(), baseline, 0.2) == []
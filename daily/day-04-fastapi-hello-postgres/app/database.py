@@ -1,18 +1,194 @@
 import os
-from sqlalchemy import create_engine, text 
-from sqlalchemy.orm import sessionmaker 
+import threading
+
 from dotenv import load_dotenv 
 
-load_dotenv() # loads env file
+# Nothing here imports SQLAlchemy or a database driver at module level: the
+# engines are built on first use, so importing the app (and serving routes
+# that never touch the database) doesn't pay for the DB stack.
+
+
+def pool_options():
+    """Pool tuning. Each engine (sync and async) gets its own pool of this size."""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
+
+
+class _built_once:
+    """Like ``functools.cached_property``, but builds under a lock.
+
+    ``cached_property`` has no lock on Python 3.12+, so concurrent first
+    uses from the threadpool could each build (and leak) an engine. Each
+    attribute has its own lock per instance, so building the async engine
+    on the event loop never waits behind a sync engine build in a thread.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.lock_name = f"_{name}_lock"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # setdefault is atomic, so racing first uses agree on one lock.
+        with instance.__dict__.setdefault(self.lock_name, threading.Lock()):
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.build(instance)
+            return instance.__dict__[self.name]
+
+
+class Database:
+    """Lazily created sync/async engines and session factories for one URL.
+
+    Connection liveness check on checkout (``pre_ping``):
+      always - ping on every checkout (pool_pre_ping)
+      idle   - ping only connections idle for ``ping_interval`` seconds
+      off    - rely on recycling and disconnect invalidation alone
+    """
+
+    def __init__(self, url, async_url=None, pool_options=None, pre_ping="idle", ping_interval=30.0):
+        if pre_ping not in ("always", "idle", "off"):
+            raise RuntimeError("DB_POOL_PRE_PING must be one of: always, idle, off")
+        self.url = url
+        self._async_url = async_url
+        self.pool_options = pool_options or {}
+        self.pre_ping = pre_ping
+        self.ping_interval = ping_interval
+
+    @property
+    def async_url(self):
+        # The async engine talks to the same database through asyncpg. Pass
+        # an explicit async URL when the sync one carries driver-specific
+        # options (e.g. psycopg2's sslmode) that asyncpg does not understand.
+        if self._async_url:
+            return self._async_url
+        from sqlalchemy.engine import make_url
+        return make_url(self.url).set(drivername="postgresql+asyncpg")
+
+    @_built_once
+    def engine(self):
+        """Sync engine, kept for scripts and anything that still runs in a thread."""
+        from sqlalchemy import create_engine
+        from server_timing.sqla import instrument_engine
+        from app.pool import TimedQueuePool, ping_after_idle
+
+        engine = create_engine(
+            self.url,
+            poolclass=TimedQueuePool,
+            pool_pre_ping=self.pre_ping == "always",
+            **self.pool_options,
+        )
+        if self.pre_ping == "idle":
+            ping_after_idle(engine, self.ping_interval)
+        instrument_engine(engine)
+        return engine
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise RuntimeError("DATABASE_URL not set")
+    @_built_once
+    def async_engine(self):
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from server_timing.sqla import instrument_engine
+        from app.pool import TimedAsyncAdaptedQueuePool, ping_after_idle
+
+        engine = create_async_engine(
+            self.async_url,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            pool_pre_ping=self.pre_ping == "always",
+            **self.pool_options,
+        )
+        if self.pre_ping == "idle":
+            ping_after_idle(engine.sync_engine, self.ping_interval)
+        instrument_engine(engine.sync_engine)
+        return engine
+
+    @_built_once
+    def SessionLocal(self):
+        from sqlalchemy.orm import sessionmaker
+        return sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+
+    @_built_once
+    def AsyncSessionLocal(self):
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        return async_sessionmaker(bind=self.async_engine, expire_on_commit=False)
+
+    def ping(self):
+        """Simple check that queries Postgres for the current time."""
+        from sqlalchemy import text
+        with self.engine.connect() as conn:
+            return conn.execute(text("SELECT NOW()")).scalar()
+
+    async def ping_async(self):
+        """Async version of ping that doesn't hold a worker thread."""
+        from sqlalchemy import text
+        async with self.async_engine.connect() as conn:
+            return (await conn.execute(text("SELECT NOW()"))).scalar()
+
+    def pool_status(self):
+        """Pool metrics for the engines that have been created so far."""
+        from app.pool import pool_status
+
+        status = {}
+        if "engine" in self.__dict__:
+            status["sync"] = pool_status(self.engine.pool)
+        if "async_engine" in self.__dict__:
+            status["async"] = pool_status(self.async_engine.pool)
+        return status
+
+    async def dispose(self):
+        if "engine" in self.__dict__:
+            self.engine.dispose()
+        if "async_engine" in self.__dict__:
+            await self.async_engine.dispose()
+
+
+def database_from_env():
+    """Build a Database from DATABASE_URL and friends, or None if it isn't set."""
+    load_dotenv() # loads env file
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        return None
+    return Database(
+        url,
+        async_url=os.getenv("ASYNC_DATABASE_URL"),
+        pool_options=pool_options(),
+        pre_ping=os.getenv("DB_POOL_PRE_PING", "idle"),
+        ping_interval=float(os.getenv("DB_POOL_PING_INTERVAL", "30")),
+    )
+
+
+_default = None
+_default_lock = threading.Lock()
+
+def get_default_database():
+    """Process-wide Database for scripts and helpers outside a request."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = database_from_env()
+            if _default is None:
+                raise RuntimeError("DATABASE_URL not set")
+        return _default
+
+
+def __getattr__(name):
+    # Keep `from app.database import engine, SessionLocal` working for
+    # scripts without building anything at import time.
+    if name in ("engine", "async_engine", "SessionLocal", "AsyncSessionLocal"):
+        return getattr(get_default_database(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 def ping_db():
     """Simple check that queries Postgres for the current time."""
-    with engine.connect() as conn:
-        return conn.execute(text("SELECT NOW()")).scalar()
+    return get_default_database().ping()
+
+async def ping_db_async():
+    """Async version of ping_db that doesn't hold a worker thread."""
+    return await get_default_database().ping_async()
@@ -0,0 +1,21 @@
+from fastapi import Depends, HTTPException, Request
+
+
+def get_database(request: Request):
+    """The Database set up by the app lifespan; 503 when none is configured."""
+    database = getattr(request.app.state, "database", None)
+    if database is None:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    return database
+
+
+def get_session(database=Depends(get_database)):
+    with database.SessionLocal() as session:
+        yield session
+
+
+def get_food_repository(session=Depends(get_session)):
+    # Imported here so the ORM is only loaded by routes that use it.
+    from app.repository import FoodRepository
+
+    return FoodRepository(session)
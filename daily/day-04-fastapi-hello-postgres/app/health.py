@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+
+class HealthCache:
+    """Caches the result of an async health check for a short TTL.
+
+    Concurrent callers that find the cache stale share one in-flight check
+    instead of each querying the database, and ``run_refresher`` keeps the
+    result warm in the background so probes normally never wait on it. The
+    refresher stays idle until the first ``get``, so a process that is never
+    probed never touches the database (or builds an engine) for this. A
+    check that takes longer than ``timeout`` seconds counts as a failure, so
+    a hung database yields a fast unhealthy result instead of hung probes.
+    """
+
+    def __init__(self, check, ttl=2.0, refresh_interval=1.0, timeout=2.0):
+        self._check = check
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+        self._result = None
+        self._checked_at = None
+        self._inflight = None
+        self._requested = asyncio.Event()
+
+    def age(self):
+        if self._checked_at is None:
+            return None
+        return time.monotonic() - self._checked_at
+
+    async def get(self):
+        """Return ``(result, age_seconds)``, re-checking if the cache is stale."""
+        self._requested.set()
+        age = self.age()
+        if age is None or age > self.ttl:
+            await self.refresh()
+        return self._result, self.age()
+
+    async def refresh(self):
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._run())
+        # Shield so a cancelled probe doesn't cancel the shared check.
+        await asyncio.shield(self._inflight)
+
+    async def _run(self):
+        try:
+            now = await asyncio.wait_for(self._check(), self.timeout)
+            self._result = {"ok": True, "postgres_now": str(now)}
+        except asyncio.TimeoutError:
+            self._result = {"ok": False, "error": f"Health check timed out after {self.timeout}s"}
+        except Exception as exc:
+            self._result = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        finally:
+            self._checked_at = time.monotonic()
+            self._inflight = None
+
+    async def run_refresher(self):
+        await self._requested.wait()
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
@@ -1,13 +1,106 @@
-from fastapi import FastAPI 
-from app.database import ping_db 
+import asyncio
+import contextlib
+import os
+from typing import Any
 
-app = FastAPI(title="Hello FastAPI + Postgres")
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from server_timing.asgi import ServerTimingMiddleware, metrics
+from app.database import database_from_env
+from app.dependencies import get_database, get_food_repository, get_session
+from app.health import HealthCache
+from app.schemas import FOOD_NAME_MAX_LENGTH, FoodIn
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    # Only reads settings. Engines are created by the first request that
+    # needs one; the health refresher waits for the first /health/db probe.
+    database = database_from_env()
+    app.state.database = database
+    app.state.db_health = None
+    refresher = None
+    if database is not None:
+        app.state.db_health = HealthCache(
+            database.ping_async,
+            ttl=float(os.getenv("HEALTH_CACHE_TTL", "2")),
+            refresh_interval=float(os.getenv("HEALTH_REFRESH_INTERVAL", "1")),
+            timeout=float(os.getenv("HEALTH_CHECK_TIMEOUT", "2")),
+        )
+        refresher = asyncio.create_task(app.state.db_health.run_refresher())
+    yield
+    if refresher is not None:
+        refresher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await refresher
+    if database is not None:
+        await database.dispose()
+
+app = FastAPI(title="Hello FastAPI + Postgres", lifespan=lifespan)
+app.add_middleware(ServerTimingMiddleware)
 
 @app.get("/")
 def read_root():
     return {"message": "Hello World"}
 
-@app.get("health/db")
-def db_health():
-    current_time = ping_db()
-    return {"postgres_now": str(current_time)}
\ No newline at end of file
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    return await metrics(request)
+
+@app.get("/health/db")
+async def db_health(request: Request):
+    cache = getattr(request.app.state, "db_health", None)
+    if cache is None:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    result, age = await cache.get()
+    body = {**result, "age_seconds": round(age, 3)}
+    return JSONResponse(body, status_code=200 if result["ok"] else 503)
+
+@app.get("/metrics/db-pool")
+def db_pool_metrics(database=Depends(get_database)):
+    return database.pool_status()
+
+@app.get("/foods")
+def list_foods(
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: int | None = None,
+    foods=Depends(get_food_repository),
+):
+    page = foods.list(limit=limit, after_id=after_id)
+    return {
+        "foods": [{"id": food.id, "name": food.name} for food in page],
+        "next_after_id": page[-1].id if len(page) == limit else None,
+    }
+
+@app.post("/foods", status_code=201)
+def add_food(food: FoodIn, foods=Depends(get_food_repository), session=Depends(get_session)):
+    name = food.name
+    if not name:
+        raise HTTPException(status_code=422, detail="Field 'name' is required")
+    if not foods.add(name):
+        raise HTTPException(status_code=409, detail="Food already exists")
+    session.commit()
+    return {"added": name}
+
+def bulk_food_name(item):
+    """The stripped name of one bulk item, or None if the item is invalid.
+
+    Same rules as the Flask service's /foods/bulk (plus the column length):
+    an item that isn't an object, or whose name is missing, not a string or
+    blank, is counted as invalid rather than failing the whole request.
+    """
+    name = item.get("name") if isinstance(item, dict) else None
+    if not isinstance(name, str):
+        return None
+    name = name.strip()
+    return name if 0 < len(name) <= FOOD_NAME_MAX_LENGTH else None
+
+@app.post("/foods/bulk")
+def add_foods_bulk(items: list[Any] = Body(), foods=Depends(get_food_repository), session=Depends(get_session)):
+    names = [name for name in map(bulk_food_name, items) if name is not None]
+    added = foods.add_many(names)
+    session.commit()
+    return {
+        "added": len(added),
+        "duplicate": len(names) - len(added),
+        "invalid": len(items) - len(names),
+    }
@@ -0,0 +1,39 @@
+"""ORM models.
+
+Create the tables once against the configured database with:
+
+    python -m app.models
+"""
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.schemas import FOOD_NAME_MAX_LENGTH
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Food(Base):
+    __tablename__ = "foods"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(FOOD_NAME_MAX_LENGTH))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+# Case-insensitive uniqueness lives in the database, so dedup is one index
+# lookup per row and holds across every worker writing to the table.
+Index("uq_foods_name_lower", func.lower(Food.name), unique=True)
+
+
+def create_tables(engine):
+    Base.metadata.create_all(engine)
+
+
+if __name__ == "__main__":
+    from app.database import get_default_database
+
+    create_tables(get_default_database().engine)
@@ -0,0 +1,102 @@
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+import server_timing
+
+
+class CheckoutStats:
+    """Running totals of how long pool checkouts took."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def as_dict(self):
+        with self._lock:
+            avg = self.total / self.count if self.count else 0.0
+            return {
+                "count": self.count,
+                "avg_ms": round(avg * 1000, 3),
+                "max_ms": round(self.max * 1000, 3),
+                "total_ms": round(self.total * 1000, 3),
+            }
+
+
+class _TimedCheckoutMixin:
+    """Times ``_do_get``, i.e. waiting for a free connection (or opening one).
+
+    The wait is also charged to the ``checkout`` span of the current request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkout_stats.record(elapsed)
+            server_timing.add("checkout", elapsed)
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def ping_after_idle(engine, interval):
+    """Ping a connection on checkout only if it sat idle for ``interval`` seconds.
+
+    This replaces ``pool_pre_ping``'s round trip on every checkout. Busy
+    connections are trusted; a connection that dies mid-use is still caught
+    by SQLAlchemy's disconnect handling, which invalidates the pool so the
+    remaining stale connections are replaced on their next checkout.
+    """
+
+    @event.listens_for(engine, "connect")
+    @event.listens_for(engine, "checkin")
+    def touch(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get("last_used")
+        if last_used is not None and time.monotonic() - last_used < interval:
+            return
+        # The dialect's own ping: on asyncpg it doesn't open a transaction
+        # the way a cursor's SELECT 1 would.
+        try:
+            alive = engine.dialect.do_ping(dbapi_connection)
+        except Exception as err:
+            # The pool discards this connection and retries with a new one.
+            raise exc.DisconnectionError() from err
+        if not alive:
+            raise exc.DisconnectionError()
+
+
+def pool_status(pool):
+    """Snapshot of a QueuePool's occupancy and checkout timings."""
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "checkout_wait": pool.checkout_stats.as_dict(),
+    }
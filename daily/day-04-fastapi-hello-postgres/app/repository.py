@@ -0,0 +1,51 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models import Food
+
+# One bound parameter per row, far below Postgres' 65535 limit, while still
+# amortizing the round trip over many rows.
+BATCH_SIZE = 1000
+
+
+class FoodRepository:
+    """Food persistence on top of a SessionLocal session.
+
+    Inserts go through ``INSERT ... ON CONFLICT DO NOTHING`` against the
+    ``lower(name)`` unique index, so duplicates are skipped by Postgres
+    instead of being looked up first. The caller owns the transaction.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def _insert(self, names):
+        return (
+            insert(Food)
+            .values([{"name": name} for name in names])
+            .on_conflict_do_nothing(index_elements=[func.lower(Food.name)])
+            .returning(Food.name)
+        )
+
+    def add(self, name):
+        """Insert ``name``. Returns False if an equivalent name already exists."""
+        return self.session.execute(self._insert([name])).first() is not None
+
+    def add_many(self, names, batch_size=BATCH_SIZE):
+        """Insert ``names`` in multi-row batches. Returns the names that were added.
+
+        Names that duplicate an existing row, or an earlier name in the
+        same call, are skipped.
+        """
+        added = []
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            added.extend(self.session.scalars(self._insert(batch)))
+        return added
+
+    def list(self, limit=100, after_id=None):
+        """One page of foods ordered by id, starting after ``after_id``."""
+        query = select(Food).order_by(Food.id).limit(limit)
+        if after_id is not None:
+            query = query.where(Food.id > after_id)
+        return list(self.session.scalars(query))
@@ -0,0 +1,12 @@
+from typing import Annotated
+
+from pydantic import BaseModel, StringConstraints
+
+# Matches the foods.name column; kept here so request validation doesn't
+# have to import the ORM models.
+FOOD_NAME_MAX_LENGTH = 200
+
+
+class FoodIn(BaseModel):
+    name: Annotated[str, StringConstraints(strip_whitespace=True, max_length=FOOD_NAME_MAX_LENGTH)]
+
@@ -0,0 +1,54 @@
+"""Benchmark: inserting foods one row at a time vs in multi-row batches.
+
+Needs a Postgres at DATABASE_URL (``docker compose up -d`` starts one).
+The foods table is dropped and recreated for each mode, so point this at
+a scratch database.
+
+    python -m bench.foods_insert [rows] [batch_size]
+"""
+import sys
+import time
+
+from app.database import get_default_database
+from app.models import Base, create_tables
+from app.repository import BATCH_SIZE, FoodRepository
+
+
+def reset(engine):
+    Base.metadata.drop_all(engine)
+    create_tables(engine)
+
+
+def one_at_a_time(repo, names):
+    return sum(repo.add(name) for name in names)
+
+
+def batched(repo, names, batch_size):
+    return len(repo.add_many(names, batch_size=batch_size))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else BATCH_SIZE
+    database = get_default_database()
+    # Every tenth name repeats an earlier one in a different case, so both
+    # paths also exercise the unique index rejecting duplicates.
+    names = [f"FOOD-{i - 1}" if i and i % 10 == 0 else f"food-{i}" for i in range(rows)]
+
+    print(f"{'mode':>14}  {'rows':>8}  {'added':>8}  {'seconds':>8}  {'rows/s':>9}")
+    for label, run in (
+        ("one at a time", one_at_a_time),
+        (f"batch {batch_size}", lambda repo, names: batched(repo, names, batch_size)),
+    ):
+        reset(database.engine)
+        with database.SessionLocal() as session:
+            repo = FoodRepository(session)
+            start = time.perf_counter()
+            added = run(repo, names)
+            session.commit()
+            elapsed = time.perf_counter() - start
+        print(f"{label:>14}  {rows:>8}  {added:>8}  {elapsed:>8.2f}  {rows / elapsed:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
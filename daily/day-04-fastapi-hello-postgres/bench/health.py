@@ -0,0 +1,93 @@
+"""Load benchmark: sync vs async DB health checks.
+
+Fires ``--requests`` health checks with ``--concurrency`` in flight against
+two in-process routes, one calling ``ping_db`` from the threadpool and one
+awaiting ``ping_db_async``, and reports p50/p99 latency and requests/s.
+
+Against a local Postgres (DATABASE_URL set):
+
+    python -m bench.health --requests 1000 --concurrency 1000
+
+Without a database, ``--simulate-ms`` swaps both pings for a stand-in that
+sleeps for the given round-trip time (blocking for sync, awaiting for async):
+
+    python -m bench.health --simulate-ms 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+
+
+def build_app(ping, ping_async):
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_health():
+        return {"postgres_now": str(ping())}
+
+    @app.get("/async")
+    async def async_health():
+        return {"postgres_now": str(await ping_async())}
+
+    return app
+
+
+def stand_ins(delay):
+    def ping():
+        time.sleep(delay)
+        return time.time()
+
+    async def ping_async():
+        await asyncio.sleep(delay)
+        return time.time()
+
+    return ping, ping_async
+
+
+async def run(client, path, requests, concurrency):
+    limit = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with limit:
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000, requests / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--simulate-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.simulate_ms is not None:
+        ping, ping_async = stand_ins(args.simulate_ms / 1000)
+    else:
+        from app.database import ping_db, ping_db_async
+        ping, ping_async = ping_db, ping_db_async
+
+    transport = httpx.ASGITransport(app=build_app(ping, ping_async))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'path':>6}  {'p50 ms':>8}  {'p99 ms':>8}  {'req/s':>8}")
+        for path in ("/sync", "/async"):
+            await run(client, path, min(args.requests, 50), args.concurrency)  # warm up
+            p50, p99, rps = await run(client, path, args.requests, args.concurrency)
+            print(f"{path:>6}  {p50:>8.1f}  {p99:>8.1f}  {rps:>8.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Import-time and cold-start benchmark for the app.
+
+Measures, in fresh interpreters:
+
+* ``python -X importtime -c "import app.main"`` with no DATABASE_URL:
+  cumulative import time of the app, compared with the DB stack it no
+  longer pulls in;
+* a cold start that serves ``/`` through the lifespan, both with no
+  DATABASE_URL and with one configured (an unreachable address, nothing
+  needs to listen there).
+
+tests/test_startup.py runs the same cold start and asserts that ``/``
+answers 200 without SQLAlchemy or a driver having been imported.
+
+    python -m bench.startup [runs]
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+DB_MODULES = ("sqlalchemy", "psycopg2", "asyncpg")
+
+COLD_START = """
+import sys, time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from app.main import app
+with TestClient(app) as client:
+    response = client.get("/")
+    elapsed = time.perf_counter() - start
+    # Give lifespan background tasks a chance to run before checking.
+    time.sleep(0.3)
+loaded = [m for m in {modules!r} if m in sys.modules]
+print(response.status_code, elapsed, ",".join(loaded))
+"""
+
+
+UNREACHABLE_DATABASE_URL = "postgresql+psycopg2://bench@127.0.0.1:1/bench"
+
+
+def clean_env(database_url=""):
+    # Empty rather than unset, so a local .env can't fill them back in.
+    return {**os.environ, "DATABASE_URL": database_url, "ASYNC_DATABASE_URL": ""}
+
+
+def import_time_us(module, cwd):
+    """Cumulative microseconds ``python -X importtime`` reports for ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=clean_env(), cwd=cwd, check=True,
+    )
+    pattern = re.compile(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", re.M)
+    return int(pattern.search(result.stderr).group(1))
+
+
+def cold_start(cwd, database_url=""):
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START.format(modules=DB_MODULES)],
+        capture_output=True, text=True, env=clean_env(database_url), cwd=cwd, check=True,
+    )
+    status, elapsed, loaded = result.stdout.split(" ")
+    return int(status), float(elapsed), [m for m in loaded.strip().split(",") if m]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    app_us = [import_time_us("app.main", cwd) for _ in range(runs)]
+    db_us = [import_time_us("sqlalchemy.ext.asyncio", cwd) for _ in range(runs)]
+    print(f"import app.main              median {statistics.median(app_us) / 1000:8.1f} ms")
+    print(f"import sqlalchemy (skipped)  median {statistics.median(db_us) / 1000:8.1f} ms")
+
+    for label, database_url in (("no DB", ""), ("DB set", UNREACHABLE_DATABASE_URL)):
+        timings = []
+        for _ in range(runs):
+            _, elapsed, _ = cold_start(cwd, database_url)
+            timings.append(elapsed)
+        print(f"cold start to GET / ({label:>6}) median {statistics.median(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
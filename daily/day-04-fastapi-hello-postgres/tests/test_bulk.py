@@ -0,0 +1,48 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.dependencies import get_food_repository, get_session
+from app.main import app
+from app.schemas import FOOD_NAME_MAX_LENGTH
+
+
+class FakeFoods:
+    """Case-insensitive in-memory stand-in for FoodRepository."""
+
+    def __init__(self):
+        self.keys = set()
+
+    def add_many(self, names):
+        added = []
+        for name in names:
+            if name.lower() not in self.keys:
+                self.keys.add(name.lower())
+                added.append(name)
+        return added
+
+
+class FakeSession:
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    foods = FakeFoods()
+    app.dependency_overrides[get_food_repository] = lambda: foods
+    app.dependency_overrides[get_session] = FakeSession
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_bad_items_are_counted_not_rejected(client):
+    response = client.post("/foods/bulk", json=[
+        {"name": " Pizza "}, {"name": "PIZZA"}, "s", {"x": 1}, {"name": None}, {"name": 3},
+        {"name": "  "}, {"name": "x" * (FOOD_NAME_MAX_LENGTH + 1)}, None, [], {"name": "Taco"},
+    ])
+    assert response.status_code == 200
+    assert response.json() == {"added": 2, "duplicate": 1, "invalid": 8}
+
+
+def test_body_that_is_not_an_array_is_rejected(client):
+    assert client.post("/foods/bulk", json={"name": "Pizza"}).status_code == 422
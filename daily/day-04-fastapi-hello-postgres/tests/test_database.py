@@ -0,0 +1,44 @@
+import threading
+import time
+
+from app.database import _built_once
+
+
+class Slow:
+    def __init__(self):
+        self.builds = []
+
+    @_built_once
+    def first(self):
+        self.builds.append("first")
+        time.sleep(0.3)
+        return object()
+
+    @_built_once
+    def second(self):
+        self.builds.append("second")
+        return object()
+
+
+def test_concurrent_first_uses_build_once():
+    obj = Slow()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(obj.first)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert obj.builds == ["first"]
+    assert all(result is results[0] for result in results)
+
+
+def test_attributes_do_not_wait_on_each_other():
+    obj = Slow()
+    thread = threading.Thread(target=lambda: obj.first)
+    thread.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    obj.second
+    elapsed = time.perf_counter() - start
+    thread.join()
+    assert elapsed < 0.1
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from app.health import HealthCache
+
+
+class Check:
+    """Counts calls; each call waits ``delay`` seconds, then returns a timestamp."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return "2026-01-01 00:00:00"
+
+
+def test_concurrent_gets_share_one_check():
+    check = Check(delay=0.05)
+
+    async def main():
+        cache = HealthCache(check)
+        return await asyncio.gather(*(cache.get() for _ in range(100)))
+
+    results = asyncio.run(main())
+    assert check.calls == 1
+    assert all(result == {"ok": True, "postgres_now": "2026-01-01 00:00:00"} for result, _ in results)
+
+
+def test_stale_cache_is_refreshed():
+    check = Check()
+
+    async def main():
+        cache = HealthCache(check, ttl=0.05)
+        await cache.get()
+        await cache.get()
+        assert check.calls == 1
+        await asyncio.sleep(0.1)
+        _, age = await cache.get()
+        return age
+
+    age = asyncio.run(main())
+    assert check.calls == 2
+    assert age < 0.05
+
+
+def test_hung_check_fails_within_timeout():
+    check = Check(delay=60)
+
+    async def main():
+        cache = HealthCache(check, timeout=0.1)
+        start = time.perf_counter()
+        result, _ = await cache.get()
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(main())
+    assert result == {"ok": False, "error": "Health check timed out after 0.1s"}
+    assert elapsed < 1
+
+
+def test_refresher_waits_for_the_first_probe():
+    check = Check()
+
+    async def main():
+        cache = HealthCache(check, refresh_interval=0.01)
+        refresher = asyncio.create_task(cache.run_refresher())
+        await asyncio.sleep(0.1)
+        calls_before_probe = check.calls
+        await cache.get()
+        await asyncio.sleep(0.1)
+        refresher.cancel()
+        return calls_before_probe
+
+    assert asyncio.run(main()) == 0
+    assert check.calls > 1
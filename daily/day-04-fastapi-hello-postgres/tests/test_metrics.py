@@ -0,0 +1,14 @@
+from fastapi.testclient import TestClient
+from server_timing.core import REGISTRY
+
+from app.main import app
+
+
+def test_metrics_and_404s_get_separate_route_labels():
+    client = TestClient(app)
+    client.get("/metrics")
+    client.get("/no-such-page")
+    body = client.get("/metrics").text
+    assert 'route="/metrics",status="200"' in body
+    assert 'route="<unmatched>",status="404"' in body
+    assert ("GET", "<unmatched>", "200") not in REGISTRY.requests._series
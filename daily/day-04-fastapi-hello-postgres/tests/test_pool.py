@@ -0,0 +1,82 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from app import pool as pool_module
+from app.pool import TimedQueuePool, ping_after_idle, pool_status
+
+INTERVAL = 30.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pool_module, "time", SimpleNamespace(
+        monotonic=lambda: now[0], perf_counter=time.perf_counter,
+    ))
+    return now
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=0)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def pings(engine, monkeypatch):
+    calls = []
+
+    def do_ping(dbapi_connection):
+        calls.append(dbapi_connection)
+        return True
+
+    monkeypatch.setattr(engine.dialect, "do_ping", do_ping)
+    ping_after_idle(engine, INTERVAL)
+    return calls
+
+
+def checkout(engine):
+    engine.raw_connection().close()
+
+
+def test_recently_used_connection_is_not_pinged(engine, pings, clock):
+    checkout(engine)
+    clock[0] += INTERVAL - 1
+    checkout(engine)
+    assert pings == []
+
+
+def test_idle_connection_is_pinged_once(engine, pings, clock):
+    checkout(engine)
+    clock[0] += INTERVAL + 1
+    checkout(engine)
+    checkout(engine)
+    assert len(pings) == 1
+
+
+def test_failed_ping_replaces_the_connection(engine, pings, clock, monkeypatch):
+    connects = []
+    event.listen(engine, "connect", lambda *args: connects.append(args))
+    checkout(engine)
+    clock[0] += INTERVAL + 1
+    monkeypatch.setattr(engine.dialect, "do_ping", lambda dbapi_connection: False)
+    checkout(engine)
+    assert len(connects) == 2
+
+
+def test_pool_status_counts_checkouts(engine):
+    assert pool_status(engine.pool)["checkout_wait"]["count"] == 0
+
+    conn = engine.raw_connection()
+    status = pool_status(engine.pool)
+    assert (status["size"], status["checked_out"], status["idle"], status["overflow"]) == (1, 1, 0, 0)
+
+    conn.close()
+    status = pool_status(engine.pool)
+    assert (status["checked_out"], status["idle"]) == (0, 1)
+    assert status["checkout_wait"]["count"] == 1
+    assert status["checkout_wait"]["max_ms"] >= status["checkout_wait"]["avg_ms"] >= 0
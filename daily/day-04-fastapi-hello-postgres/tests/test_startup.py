@@ -0,0 +1,14 @@
+import os
+
+import pytest
+
+from bench.startup import UNREACHABLE_DATABASE_URL, cold_start
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("database_url", ["", UNREACHABLE_DATABASE_URL], ids=["no-db", "db-set"])
+def test_cold_start_serves_root_without_the_db_stack(database_url):
+    status, _, loaded = cold_start(SERVICE_DIR, database_url)
+    assert status == 200
+    assert loaded == []
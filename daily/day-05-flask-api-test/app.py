@@ -1,30 +1,142 @@
+import base64
+import binascii
+
 from flask import Flask, request, jsonify 
+from server_timing import span, timed
+from server_timing.flask_ext import init_app as init_server_timing
+
+from ingest import MalformedBody, iter_json_array, iter_ndjson
+from store import FoodStore
 
 app = Flask(__name__)
+# Bounds how long one bulk upload can keep a worker busy.
+app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024
+init_server_timing(app)
 
-FOODS = []
+FOODS = FoodStore()
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+BULK_BATCH_SIZE = 1000
+NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
 
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
+def encode_cursor(position):
+    return base64.urlsafe_b64encode(f"p:{position}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, position = raw.split(":", 1)
+        if prefix == "p" and position.isdigit():
+            return int(position)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        pass
+    raise ValueError("Invalid cursor")
+
 @app.get("/foods")
 def foods():
-    return {"foods": []}
+    raw_limit = request.args.get("limit")
+    try:
+        limit = int(raw_limit) if raw_limit is not None else DEFAULT_PAGE_SIZE
+    except ValueError:
+        return jsonify({"error": "'limit' must be an integer"}), 400
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"'limit' must be between 1 and {MAX_PAGE_SIZE}"}), 400
+
+    cursor = request.args.get("cursor")
+    try:
+        start = decode_cursor(cursor) if cursor else 0
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    # The ETag only depends on the store version, so a poll with an
+    # unchanged list is answered without touching or serializing items.
+    if request.if_none_match.contains_weak(FOODS.etag):
+        response = app.response_class(status=304)
+        response.set_etag(FOODS.etag)
+        return response
+
+    items, next_start, etag = FOODS.page(start, limit)
+    with span("serialize"):
+        response = jsonify({
+            "foods": items,
+            "next_cursor": encode_cursor(next_start) if next_start is not None else None,
+        })
+    response.set_etag(etag)
+    return response
 
 @app.post("/foods")
 def add_food():
-    data = request.get_json(silent=True) or {}
+    with span("parse"):
+        data = request.get_json(silent=True) or {}
     name = (data.get("name") or "").strip()
 
     if not name: 
         return jsonify({"error": "Field 'name' is required"})
     
-    if any(f.lower() == name.lower() for f in FOODS):
+    with span("dedup"):
+        added = FOODS.add(name)
+    if not added:
         return jsonify({"error": "Food already exists"}), 409
     
-    FOODS.append(name)
     return {"added": name, "count": len(FOODS)}, 201
 
+@app.post("/foods/bulk")
+def add_foods_bulk():
+    """Add foods from a JSON array or NDJSON body, streamed in batches.
+
+    Items are committed batch by batch while the body is still being read.
+    If the body turns out to be malformed partway through, the items before
+    the error have already been added, so the response is a 200 carrying
+    both ``error`` and the per-item ``results``; only a body that fails
+    before any item is read gets a 400.
+    """
+    if request.mimetype in NDJSON_TYPES:
+        items = (value if ok else None for ok, value in iter_ndjson(request.stream))
+    else:
+        items = iter_json_array(request.stream)
+    items = timed(items, "parse")
+
+    results = []
+    batch = []
+
+    def flush():
+        with span("dedup"):
+            added = FOODS.add_many([name for _, name in batch])
+        for (index, name), ok in zip(batch, added):
+            results[index] = {"name": name, "status": "added" if ok else "duplicate"}
+        batch.clear()
+
+    try:
+        for item in items:
+            name = item.get("name") if isinstance(item, dict) else None
+            name = name.strip() if isinstance(name, str) else ""
+            if not name:
+                results.append({"status": "invalid"})
+                continue
+            results.append(None)
+            batch.append((len(results) - 1, name))
+            if len(batch) >= BULK_BATCH_SIZE:
+                flush()
+    except MalformedBody as exc:
+        if not results:
+            return jsonify({"error": str(exc)}), 400
+        error = str(exc)
+    else:
+        error = None
+    flush()
+
+    summary = {"added": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        summary[result["status"]] += 1
+    body = {**summary, "count": len(FOODS), "results": results}
+    if error:
+        body["error"] = error
+    return body
+
 if __name__ == "__main__":
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""Throughput benchmark: POST /foods one at a time vs POST /foods/bulk.
+
+Runs against the app in-process through Flask's test client:
+
+    python -m bench.bulk [items]
+"""
+import json
+import sys
+import time
+
+import app as service
+from store import FoodStore
+
+
+def reset():
+    service.FOODS = FoodStore()
+
+
+def single(client, names):
+    for name in names:
+        client.post("/foods", json={"name": name})
+
+
+def bulk_array(client, names):
+    client.post("/foods/bulk", json=[{"name": name} for name in names])
+
+
+def bulk_ndjson(client, names):
+    body = "".join(json.dumps({"name": name}) + "\n" for name in names)
+    client.post("/foods/bulk", data=body, content_type="application/x-ndjson")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    names = [f"food-{i}" for i in range(count)]
+    client = service.app.test_client()
+
+    print(f"{'mode':>12}  {'items':>8}  {'seconds':>8}  {'items/s':>10}")
+    for label, run in (("single", single), ("bulk array", bulk_array), ("bulk ndjson", bulk_ndjson)):
+        reset()
+        start = time.perf_counter()
+        run(client, names)
+        elapsed = time.perf_counter() - start
+        assert len(service.FOODS) == count, label
+        print(f"{label:>12}  {count:>8}  {elapsed:>8.3f}  {count / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
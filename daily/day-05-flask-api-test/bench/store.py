@@ -0,0 +1,42 @@
+"""Micro-benchmark: per-insert cost of FoodStore.add as the store grows.
+
+Run from the service directory:
+
+    python -m bench.store
+"""
+import time
+
+from store import FoodStore
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SAMPLE = 1_000
+
+
+def per_insert_ns(size):
+    store = FoodStore()
+    for i in range(size):
+        store.add(f"food-{i}")
+
+    # Time a fixed batch of fresh inserts plus a batch of duplicate checks
+    # once the store already holds ``size`` items.
+    start = time.perf_counter_ns()
+    for i in range(SAMPLE):
+        store.add(f"extra-{i}")
+    inserts = (time.perf_counter_ns() - start) / SAMPLE
+
+    start = time.perf_counter_ns()
+    for i in range(SAMPLE):
+        store.add(f"FOOD-{i}")
+    duplicates = (time.perf_counter_ns() - start) / SAMPLE
+    return inserts, duplicates
+
+
+def main():
+    print(f"{'items':>10}  {'insert ns':>10}  {'duplicate ns':>12}")
+    for size in SIZES:
+        inserts, duplicates = per_insert_ns(size)
+        print(f"{size:>10}  {inserts:>10.0f}  {duplicates:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
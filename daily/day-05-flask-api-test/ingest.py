@@ -0,0 +1,208 @@
+"""Incremental parsers for bulk request bodies.
+
+Both parsers read the body in fixed-size chunks from a file-like stream and
+yield one item at a time, so a large upload never has to sit in memory as a
+single string. Each character is scanned once, and a single line or array
+element is capped at ``max_item_size`` characters.
+"""
+import codecs
+import json
+import re
+
+CHUNK_SIZE = 64 * 1024
+MAX_ITEM_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_NON_WHITESPACE = re.compile(r"[^ \t\r\n]")
+# Characters that can end or change the nesting of an array element: at the
+# top level of the element, inside an object/array, and inside a string.
+_TOP_LEVEL = re.compile(r'["\[\]{}, \t\r\n]')
+_NESTED = re.compile(r'["\[\]{}]')
+_IN_STRING = re.compile(r'["\\]')
+
+
+class MalformedBody(ValueError):
+    """Raised when a JSON array body cannot be parsed any further."""
+
+
+def _chunks(stream, chunk_size=CHUNK_SIZE):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        raw = stream.read(chunk_size)
+        if not raw:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+            return
+        yield decoder.decode(raw)
+
+
+def iter_ndjson(stream, chunk_size=CHUNK_SIZE, max_item_size=MAX_ITEM_SIZE):
+    """Yield ``(ok, value)`` for each non-blank line of an NDJSON body.
+
+    A line that is not valid JSON, or is longer than ``max_item_size``,
+    yields ``(False, None)`` and parsing carries on with the next line.
+    """
+    pieces = []
+    size = 0
+    oversized = False
+
+    def finish_line():
+        if oversized:
+            return False, None
+        line = "".join(pieces)
+        return _loads(line) if line.strip() else None
+
+    for chunk in _chunks(stream, chunk_size):
+        start = 0
+        while True:
+            newline = chunk.find("\n", start)
+            end = len(chunk) if newline == -1 else newline
+            if not oversized:
+                size += end - start
+                if size > max_item_size:
+                    # Drop what we have and skip ahead to the next newline.
+                    oversized = True
+                    pieces.clear()
+                else:
+                    pieces.append(chunk[start:end])
+            if newline == -1:
+                break
+            result = finish_line()
+            if result is not None:
+                yield result
+            pieces.clear()
+            size = 0
+            oversized = False
+            start = newline + 1
+
+    result = finish_line()
+    if result is not None:
+        yield result
+
+
+def _loads(line):
+    try:
+        return True, json.loads(line)
+    except ValueError:
+        return False, None
+
+
+class _Reader:
+    """A sliding window over the decoded body; ``pos`` is the read position."""
+
+    def __init__(self, stream, chunk_size):
+        self._chunks = _chunks(stream, chunk_size)
+        self.buffer = ""
+        self.pos = 0
+
+    def fill(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        # Only the unread tail (at most one element) is carried over.
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self.fill():
+                return ""
+
+    def element_length(self, max_item_size):
+        """Length of the JSON value starting at ``pos``, reading more as needed.
+
+        Only finds where the value ends (matching brackets and quotes);
+        ``raw_decode`` validates it afterwards. Scanning resumes where the
+        previous fill left off, so no character is looked at twice.
+        """
+        depth = 0
+        in_string = False
+        scanned = 0
+        while True:
+            buffer, base = self.buffer, self.pos
+            i = base + scanned
+            while True:
+                pattern = _IN_STRING if in_string else _NESTED if depth else _TOP_LEVEL
+                match = pattern.search(buffer, i)
+                if match is None:
+                    break
+                i = match.start()
+                char = buffer[i]
+                if in_string:
+                    if char == "\\":
+                        i += 2
+                        continue
+                    in_string = False
+                    i += 1
+                    if not depth:
+                        return i - base
+                elif char == '"':
+                    in_string = True
+                    i += 1
+                elif char in "[{":
+                    depth += 1
+                    i += 1
+                elif char in "]}" and depth:
+                    depth -= 1
+                    i += 1
+                    if not depth:
+                        return i - base
+                else:
+                    # A delimiter after a top-level scalar (or a stray "]").
+                    return i - base
+
+            scanned = max(i, len(buffer)) - base
+            if scanned > max_item_size:
+                raise MalformedBody(f"Array element longer than {max_item_size} characters")
+            if not self.fill():
+                return len(self.buffer) - self.pos
+
+
+def iter_json_array(stream, chunk_size=CHUNK_SIZE, max_item_size=MAX_ITEM_SIZE):
+    """Yield each element of a top-level JSON array as it is read.
+
+    Raises ``MalformedBody`` if the body is not a well-formed array or an
+    element is longer than ``max_item_size``; items already yielded before
+    the error stay yielded.
+    """
+    reader = _Reader(stream, chunk_size)
+    if reader.peek() != "[":
+        raise MalformedBody("Body must be a JSON array")
+    reader.pos += 1
+
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        while True:
+            if not reader.peek():
+                raise MalformedBody("Unterminated JSON array")
+            length = reader.element_length(max_item_size)
+            try:
+                value, end = _decoder.raw_decode(reader.buffer, reader.pos)
+            except ValueError:
+                raise MalformedBody("Invalid JSON in array") from None
+            if end != reader.pos + length:
+                raise MalformedBody("Invalid JSON in array")
+            reader.pos = end
+            yield value
+
+            char = reader.peek()
+            if char == "]":
+                reader.pos += 1
+                break
+            if not char:
+                raise MalformedBody("Unterminated JSON array")
+            if char != ",":
+                raise MalformedBody("Expected ',' or ']' in JSON array")
+            reader.pos += 1
+
+    if reader.peek():
+        raise MalformedBody("Unexpected data after JSON array")
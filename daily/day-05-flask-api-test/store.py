@@ -0,0 +1,79 @@
+import threading
+import uuid
+
+
+class FoodStore:
+    """In-process food store with a case-insensitive unique index.
+
+    Items are kept in insertion order for listing, and a set of casefolded
+    names gives O(1) duplicate checks. All access goes through a lock so the
+    store is safe to share across the threads of a threaded WSGI server.
+    """
+
+    def __init__(self):
+        self._items = []
+        self._keys = set()
+        self._lock = threading.Lock()
+        # ``version`` is bumped on every mutation; ``epoch`` tells versions
+        # from different store instances (e.g. across restarts) apart.
+        self.epoch = uuid.uuid4().hex[:12]
+        self.version = 0
+
+    @staticmethod
+    def normalize(name):
+        return name.casefold()
+
+    def add(self, name):
+        """Add ``name`` unless an equivalent name exists. Returns True if added."""
+        key = self.normalize(name)
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            self._items.append(name)
+            self.version += 1
+            return True
+
+    def add_many(self, names):
+        """Add ``names`` in one locked pass. Returns one bool per name.
+
+        Duplicates within the batch are caught as well as duplicates of
+        items already in the store.
+        """
+        keyed = [(self.normalize(name), name) for name in names]
+        results = []
+        with self._lock:
+            for key, name in keyed:
+                if key in self._keys:
+                    results.append(False)
+                    continue
+                self._keys.add(key)
+                self._items.append(name)
+                results.append(True)
+            if any(results):
+                self.version += 1
+        return results
+
+    def page(self, start, limit):
+        """Return ``(items, next_start, etag)`` for one page of the listing.
+
+        Items are append-only, so a position is a stable keyset cursor: a
+        page never skips or repeats items because of concurrent inserts.
+        ``next_start`` is None on the last page, and ``etag`` is the one the
+        listing had when the page was read.
+        """
+        with self._lock:
+            items = self._items[start:start + limit]
+            end = start + len(items)
+            next_start = end if end < len(self._items) else None
+            return items, next_start, self.etag_for(self.version)
+
+    def etag_for(self, version):
+        return f"{self.epoch}-{version}"
+
+    @property
+    def etag(self):
+        return self.etag_for(self.version)
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,10 @@
+import pytest
+
+import app as service
+from store import FoodStore
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(service, "FOODS", FoodStore())
+    return service.app.test_client()
@@ -0,0 +1,42 @@
+import app as service
+
+
+def test_bulk_array_reports_each_item(client):
+    client.post("/foods", json={"name": "Pizza"})
+    response = client.post("/foods/bulk", json=[
+        {"name": "pizza"}, {"name": " Taco "}, {"name": "TACO"}, {}, "x", {"name": None},
+    ])
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body["added"], body["duplicate"], body["invalid"]) == (1, 2, 3)
+    assert body["results"][:3] == [
+        {"name": "pizza", "status": "duplicate"},
+        {"name": "Taco", "status": "added"},
+        {"name": "TACO", "status": "duplicate"},
+    ]
+    assert "error" not in body
+
+
+def test_bulk_ndjson_marks_bad_lines_invalid(client):
+    response = client.post(
+        "/foods/bulk", data='{"name": "Sushi"}\nnope\n\n{"name": "Ramen"}\n',
+        content_type="application/x-ndjson",
+    )
+    body = response.get_json()
+    assert response.status_code == 200
+    assert (body["added"], body["invalid"]) == (2, 1)
+
+
+def test_bulk_malformed_midway_is_200_with_error(client):
+    response = client.post("/foods/bulk", data='[{"name": "Ramen"}, oops', content_type="application/json")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["error"] == "Invalid JSON in array"
+    assert body["results"] == [{"name": "Ramen", "status": "added"}]
+    assert len(service.FOODS) == 1
+
+
+def test_bulk_malformed_from_the_start_is_400(client):
+    response = client.post("/foods/bulk", data='{"name": "Ramen"}', content_type="application/json")
+    assert response.status_code == 400
+    assert len(service.FOODS) == 0
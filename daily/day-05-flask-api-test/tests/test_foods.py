@@ -0,0 +1,59 @@
+import pytest
+
+
+@pytest.fixture
+def foods(client):
+    client.post("/foods/bulk", json=[{"name": f"food-{i}"} for i in range(5)])
+    return client
+
+
+def test_cursor_walks_every_item_once(foods):
+    seen, cursor = [], None
+    while True:
+        query = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = foods.get("/foods", query_string=query).get_json()
+        seen += body["foods"]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [f"food-{i}" for i in range(5)]
+
+
+def test_last_page_has_no_next_cursor(foods):
+    body = foods.get("/foods", query_string={"limit": 5}).get_json()
+    assert len(body["foods"]) == 5
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["nope", "!!!", "cTpheA"])
+def test_invalid_cursor_is_400(foods, cursor):
+    response = foods.get("/foods", query_string={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Invalid cursor"}
+
+
+@pytest.mark.parametrize("limit", ["abc", "1.5", ""])
+def test_non_integer_limit_is_400(foods, limit):
+    response = foods.get("/foods", query_string={"limit": limit})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "'limit' must be an integer"}
+
+
+@pytest.mark.parametrize("limit", ["0", "1001"])
+def test_out_of_range_limit_is_400(foods, limit):
+    assert foods.get("/foods", query_string={"limit": limit}).status_code == 400
+
+
+def test_if_none_match_returns_304_until_the_list_changes(foods):
+    etag = foods.get("/foods").headers["ETag"]
+
+    response = foods.get("/foods", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.data == b""
+
+    foods.post("/foods", json={"name": "Ramen"})
+    response = foods.get("/foods", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "Ramen" in response.get_json()["foods"]
@@ -0,0 +1,84 @@
+import io
+import json
+import time
+
+import pytest
+
+from ingest import MalformedBody, iter_json_array, iter_ndjson
+
+# Small chunk sizes put chunk boundaries inside strings, numbers, escapes
+# and multi-byte characters.
+CHUNK_SIZES = [1, 2, 3, 7, 64 * 1024]
+
+
+def stream(text):
+    return io.BytesIO(text.encode("utf-8"))
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_json_array_round_trips_across_chunk_boundaries(chunk_size):
+    items = [
+        {"name": "Pizza"}, 12345, -2.5e-3, 1.5e10, "xéy \\ \"quoted\"", [1, [2, {"a": "]"}]],
+        {"name": "Ramen \U0001f35c", "tags": ["hot", "}"]}, None, True, False, "", {},
+    ]
+    body = json.dumps(items)
+    assert list(iter_json_array(stream(body), chunk_size)) == items
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_json_array_accepts_whitespace_and_empty(chunk_size):
+    assert list(iter_json_array(stream(" [ ] \n"), chunk_size)) == []
+    body = '\n[\n  {"name" : "a"} ,\n\t2\n]\n'
+    assert list(iter_json_array(stream(body), chunk_size)) == [{"name": "a"}, 2]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("body", [
+    "", "{}", '{"name": "a"}', "[1, 2", "[1 2]", "[1,", "[1,]", "[,1]",
+    '[{"a": 1}x]', '["unterminated', "[1] trailing", "[1]]", "[1][2]", "[tru]",
+])
+def test_json_array_rejects_malformed_bodies(body, chunk_size):
+    with pytest.raises(MalformedBody):
+        list(iter_json_array(stream(body), chunk_size))
+
+
+def test_json_array_keeps_items_before_an_error():
+    items = []
+    with pytest.raises(MalformedBody):
+        for item in iter_json_array(stream('[{"name": "a"}, oops]'), 4):
+            items.append(item)
+    assert items == [{"name": "a"}]
+
+
+def test_json_array_caps_element_size():
+    body = '[{"name": "ok"}, {"name": "' + "x" * 1000 + '"}]'
+    items = []
+    with pytest.raises(MalformedBody):
+        for item in iter_json_array(stream(body), 64, max_item_size=500):
+            items.append(item)
+    assert items == [{"name": "ok"}]
+
+
+def test_json_array_unterminated_element_is_linear():
+    # Regression: this used to re-decode the whole buffer on every chunk.
+    body = '[{"name": "' + "x" * (8 * 1024 * 1024)
+    start = time.perf_counter()
+    with pytest.raises(MalformedBody):
+        list(iter_json_array(stream(body), max_item_size=16 * 1024 * 1024))
+    assert time.perf_counter() - start < 2
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_ndjson_yields_invalid_lines_and_skips_blank_ones(chunk_size):
+    body = '{"name": "a"}\nnot json\n\n  \r\n{"name": "bé"}'
+    assert list(iter_ndjson(stream(body), chunk_size)) == [
+        (True, {"name": "a"}), (False, None), (True, {"name": "bé"}),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_ndjson_marks_oversized_lines_invalid(chunk_size):
+    body = '{"name": "a"}\n{"name": "' + "x" * 100 + '"}\n{"name": "b"}\n'
+    assert list(iter_ndjson(stream(body), chunk_size, max_item_size=50)) == [
+        (True, {"name": "a"}), (False, None), (True, {"name": "b"}),
+    ]
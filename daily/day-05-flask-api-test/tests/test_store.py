@@ -0,0 +1,60 @@
+import threading
+
+from store import FoodStore
+
+
+def test_add_dedups_by_casefold():
+    store = FoodStore()
+    assert store.add("Straße")
+    assert not store.add("STRASSE")
+    assert not store.add("strasse")
+    assert store.add("Pizza")
+    assert len(store) == 2
+
+
+def test_add_many_catches_duplicates_within_the_batch():
+    store = FoodStore()
+    store.add("Taco")
+    assert store.add_many(["Sushi", "TACO", "sushi", "Ramen", "Straße", "strasse"]) == [
+        True, False, False, True, True, False,
+    ]
+    items, _, _ = store.page(0, 10)
+    assert items == ["Taco", "Sushi", "Ramen", "Straße"]
+
+
+def test_version_only_bumps_when_something_is_added():
+    store = FoodStore()
+    assert store.version == 0
+    store.add("Pizza")
+    assert store.version == 1
+    store.add("PIZZA")
+    store.add_many(["pizza", "Pizza"])
+    store.add_many([])
+    assert store.version == 1
+    store.add_many(["Pizza", "Kale", "Leek"])
+    assert store.version == 2
+
+
+def test_page_walks_items_in_insertion_order():
+    store = FoodStore()
+    store.add_many([f"food-{i}" for i in range(5)])
+    assert store.page(0, 2)[:2] == (["food-0", "food-1"], 2)
+    assert store.page(2, 2)[:2] == (["food-2", "food-3"], 4)
+    assert store.page(4, 2)[:2] == (["food-4"], None)
+
+
+def test_concurrent_adds_keep_one_of_each_name():
+    store = FoodStore()
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for i in range(500):
+            store.add(f"food-{i}" if i % 2 else f"FOOD-{i}")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(store) == 500
@@ -0,0 +1,21 @@
+from server_timing.core import (
+    REGISTRY,
+    Histogram,
+    Registry,
+    RequestTiming,
+    add,
+    current,
+    span,
+    timed,
+)
+
+__all__ = [
+    "REGISTRY",
+    "Histogram",
+    "Registry",
+    "RequestTiming",
+    "add",
+    "current",
+    "span",
+    "timed",
+]
@@ -0,0 +1,58 @@
+from starlette.responses import Response
+
+from server_timing.core import PROMETHEUS_CONTENT_TYPE, REGISTRY, begin, end
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware: Server-Timing header plus per-route histograms.
+
+    The route label is the path template of the matched route: FastAPI's
+    router puts the route in ``scope["route"]``; for plain Starlette routes
+    (e.g. ``app.add_route``), which only set ``scope["endpoint"]``, it is
+    looked up on the app's router. Anything else is ``<unmatched>``.
+    """
+
+    def __init__(self, app, registry=REGISTRY):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = begin()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.header().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            total = timing.elapsed()
+            self.registry.record(scope["method"], _route_label(scope), status, timing, total)
+            end(token)
+
+
+def _route_label(scope):
+    route = scope.get("route")
+    if route is None and "endpoint" in scope:
+        router = getattr(scope.get("app"), "router", None)
+        for candidate in getattr(router, "routes", ()):
+            if getattr(candidate, "endpoint", None) is scope["endpoint"]:
+                route = candidate
+                break
+    # Unmatched URLs all share one label to keep the series count bounded.
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+async def metrics(request, registry=REGISTRY):
+    """Starlette/FastAPI endpoint serving ``registry`` in Prometheus format."""
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,158 @@
+import contextlib
+import contextvars
+import threading
+import time
+
+# Prometheus' default latency buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_current = contextvars.ContextVar("server_timing_request", default=None)
+
+
+class RequestTiming:
+    """Named sub-span durations (seconds) collected while serving one request.
+
+    Spans with the same name accumulate, so e.g. every query a request runs
+    adds to a single ``db`` entry.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.spans = {}
+
+    def add(self, name, seconds):
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def header(self, total=None):
+        """The ``Server-Timing`` header value, durations in milliseconds."""
+        total = self.elapsed() if total is None else total
+        parts = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.spans.items()]
+        parts.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(parts)
+
+
+def current():
+    """The RequestTiming of the request being served, or None outside one."""
+    return _current.get()
+
+
+def begin():
+    """Start timing a request in the current context. Returns ``(timing, token)``."""
+    timing = RequestTiming()
+    return timing, _current.set(timing)
+
+
+def end(token):
+    _current.reset(token)
+
+
+def add(name, seconds):
+    """Charge ``seconds`` to span ``name`` of the current request, if any."""
+    timing = _current.get()
+    if timing is not None:
+        timing.add(name, seconds)
+
+
+@contextlib.contextmanager
+def span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(name, time.perf_counter() - start)
+
+
+def timed(iterable, name):
+    """Yield from ``iterable``, charging the time spent producing items to ``name``."""
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            add(name, time.perf_counter() - start)
+            return
+        add(name, time.perf_counter() - start)
+        yield item
+
+
+class Histogram:
+    """A labelled Prometheus histogram."""
+
+    def __init__(self, name, documentation, labelnames, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = sorted((key, (list(c), s, n)) for key, (c, s, n) in self._series.items())
+        for key, (counts, total, count) in series:
+            labels = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+            for bound, bucket in zip(self.buckets, counts):
+                le = ",".join(labels + [f'le="{bound:g}"'])
+                lines.append(f"{self.name}_bucket{{{le}}} {bucket}")
+            le = ",".join(labels + ['le="+Inf"'])
+            lines.append(f"{self.name}_bucket{{{le}}} {count}")
+            base = "{" + ",".join(labels) + "}" if labels else ""
+            lines.append(f"{self.name}_sum{base} {total!r}")
+            lines.append(f"{self.name}_count{base} {count}")
+        return "\n".join(lines)
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Registry:
+    """Request and span histograms shared by the framework integrations."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.requests = Histogram(
+            "http_request_duration_seconds",
+            "Time spent serving HTTP requests.",
+            ("method", "route", "status"),
+            buckets,
+        )
+        self.spans = Histogram(
+            "http_request_span_duration_seconds",
+            "Time spent in named sub-spans of HTTP requests.",
+            ("method", "route", "span"),
+            buckets,
+        )
+
+    def record(self, method, route, status, timing, total):
+        self.requests.observe(total, method=method, route=route, status=status)
+        for name, seconds in timing.spans.items():
+            self.spans.observe(seconds, method=method, route=route, span=name)
+
+    def render(self):
+        return self.requests.render() + "\n" + self.spans.render() + "\n"
+
+
+REGISTRY = Registry()
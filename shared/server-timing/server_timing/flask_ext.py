@@ -0,0 +1,39 @@
+from flask import g, request
+
+from server_timing.core import PROMETHEUS_CONTENT_TYPE, REGISTRY, begin, end
+
+
+def init_app(app, registry=REGISTRY, metrics_path="/metrics"):
+    """Time every request of ``app`` and serve ``registry`` on ``metrics_path``."""
+
+    @app.before_request
+    def _start_timing():
+        g._server_timing = begin()
+
+    @app.after_request
+    def _add_header(response):
+        timing, _ = g.get("_server_timing", (None, None))
+        if timing is not None:
+            response.headers["Server-Timing"] = timing.header()
+            g._server_timing_status = response.status_code
+        return response
+
+    # Recorded at teardown rather than in after_request, which is skipped
+    # when an unhandled exception propagates, so 500s are counted too.
+    @app.teardown_request
+    def _record_timing(exc):
+        state = g.pop("_server_timing", None)
+        if state is None:
+            return
+        timing, token = state
+        status = 500 if exc is not None else g.pop("_server_timing_status", 500)
+        # Unmatched URLs all share one label to keep the series count bounded.
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        registry.record(request.method, route, status, timing, timing.elapsed())
+        end(token)
+
+    def metrics():
+        return registry.render(), 200, {"Content-Type": PROMETHEUS_CONTENT_TYPE}
+
+    app.add_url_rule(metrics_path, "server_timing_metrics", metrics, methods=["GET"])
+    return app
@@ -0,0 +1,31 @@
+import time
+
+from sqlalchemy import event
+
+from server_timing.core import add
+
+
+def instrument_engine(engine, span_name="db"):
+    """Charge the time of every statement ``engine`` runs to the current request.
+
+    Pass ``async_engine.sync_engine`` for an async engine; SQLAlchemy carries
+    the request's context into the greenlet that runs the statement.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("server_timing_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["server_timing_start"].pop()
+        add(span_name, time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(exception_context):
+        conn = exception_context.connection
+        stack = conn.info.get("server_timing_start") if conn is not None else None
+        if stack:
+            add(span_name, time.perf_counter() - stack.pop())
+
+    return engine
@@ -0,0 +1,37 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+from server_timing.asgi import ServerTimingMiddleware
+from server_timing.core import Registry
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+@pytest.fixture
+def client(registry):
+    async def item(request):
+        return PlainTextResponse(request.path_params["item_id"])
+
+    app = Starlette()
+    app.add_route("/items/{item_id}", item)
+    app.add_middleware(ServerTimingMiddleware, registry=registry)
+    return TestClient(app)
+
+
+def counts(registry):
+    return {key: series[2] for key, series in registry.requests._series.items()}
+
+
+def test_plain_starlette_route_is_labelled_by_its_path(client, registry):
+    response = client.get("/items/1")
+    assert response.headers["server-timing"].startswith("total;dur=")
+    client.get("/nope")
+    assert counts(registry) == {
+        ("GET", "/items/{item_id}", "200"): 1,
+        ("GET", "<unmatched>", "404"): 1,
+    }
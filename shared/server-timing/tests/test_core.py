@@ -0,0 +1,35 @@
+from server_timing.core import Histogram, RequestTiming
+
+
+def test_histogram_render():
+    histogram = Histogram("latency_seconds", "Request latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(0.2, route='/"b"')
+    assert histogram.render() == "\n".join([
+        "# HELP latency_seconds Request latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/\\"b\\"",le="0.1"} 0',
+        'latency_seconds_bucket{route="/\\"b\\"",le="1"} 1',
+        'latency_seconds_bucket{route="/\\"b\\"",le="+Inf"} 1',
+        'latency_seconds_sum{route="/\\"b\\""} 0.2',
+        'latency_seconds_count{route="/\\"b\\""} 1',
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 2',
+        'latency_seconds_sum{route="/a"} 0.55',
+        'latency_seconds_count{route="/a"} 2',
+    ])
+
+
+def test_histogram_render_without_observations():
+    histogram = Histogram("empty_seconds", "Nothing yet.", ("route",))
+    assert histogram.render() == "# HELP empty_seconds Nothing yet.\n# TYPE empty_seconds histogram"
+
+
+def test_header_lists_spans_then_total_in_ms():
+    timing = RequestTiming()
+    timing.add("db", 0.001)
+    timing.add("serialize", 0.0025)
+    timing.add("db", 0.002)
+    assert timing.header(total=0.0123) == "db;dur=3.00, serialize;dur=2.50, total;dur=12.30"
@@ -0,0 +1,53 @@
+import pytest
+from flask import Flask
+
+from server_timing.core import Registry
+from server_timing.flask_ext import init_app
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+@pytest.fixture
+def client(registry):
+    app = Flask(__name__)
+
+    @app.get("/items/<int:item_id>")
+    def item(item_id):
+        return {"id": item_id}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    init_app(app, registry)
+    return app.test_client()
+
+
+def counts(registry):
+    return {key: series[2] for key, series in registry.requests._series.items()}
+
+
+def test_records_route_template_and_sets_header(client, registry):
+    response = client.get("/items/1")
+    assert response.headers["Server-Timing"].startswith("total;dur=")
+    client.get("/items/2")
+    client.get("/nope")
+    assert counts(registry) == {
+        ("GET", "/items/<int:item_id>", "200"): 2,
+        ("GET", "<unmatched>", "404"): 1,
+    }
+
+
+def test_unhandled_exception_is_recorded_as_500(client, registry):
+    assert client.get("/boom").status_code == 500
+    assert counts(registry) == {("GET", "/boom", "500"): 1}
+
+
+def test_metrics_endpoint(client):
+    client.get("/items/1")
+    response = client.get("/metrics")
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert 'route="/items/<int:item_id>"' in response.get_data(as_text=True)